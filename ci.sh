@@ -23,8 +23,8 @@ run_ci () {
   poetry run mypy
   poetry check
   poetry run pip check
-  poetry run pytest --cov=tests --cov=picodi --cov-report=xml --junitxml=jcoverage.xml
-  poetry run pytest --dead-fixtures
+  poetry run pytest -m "slow or not slow" --cov=tests --cov=picodi --cov-report=xml --junitxml=jcoverage.xml
+  poetry run pytest -m "slow or not slow" --dead-fixtures
   poetry run pytest --run-benchmarks --benchmark-autosave --benchmark-compare
   poetry build
   poetry export --format=requirements.txt --output=dist/requirements.txt
@@ -6,6 +6,7 @@ import functools
 import inspect
 import logging
 import threading
+import weakref
 from collections.abc import (
     AsyncGenerator,
     Awaitable,
@@ -232,6 +233,37 @@ _scopes: dict[type[ScopeType], ScopeType] = {
     SingletonScope: SingletonScope(),
     ContextVarScope: ContextVarScope(),
 }
+# Wrappers created by `inject` mapped to the original functions.
+#   Not stored as an attribute, because `functools.wraps` would copy it
+#   to wrappers created by users.
+_injected_functions: weakref.WeakKeyDictionary[Callable, Callable] = (
+    weakref.WeakKeyDictionary()
+)
+# Trees of overrides are rebuilt on every call of injected function,
+#   so signatures are cached to not inspect the same callables again
+_signatures: weakref.WeakKeyDictionary[Callable, inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_injected_fn(dependency: DependencyCallable) -> DependencyCallable | None:
+    try:
+        return _injected_functions.get(dependency)
+    except TypeError:
+        # Wrappers created by `inject` are functions, so callables that
+        #   can't be weak referenced are never in the mapping
+        return None
+
+
+def _get_signature(call: Callable) -> inspect.Signature:
+    try:
+        return _signatures[call]
+    except KeyError:
+        signature = _signatures[call] = inspect.signature(call)
+        return signature
+    except TypeError:
+        # Callable can't be weak referenced (or hashed), so it can't be cached
+        return inspect.signature(call)
 
 
 def Provide(dependency: DependencyCallable, /) -> Any:  # noqa: N802
@@ -283,8 +315,11 @@ def inject(fn: Callable[P, T]) -> Callable[P, T]:
         def my_service(db=Provide(some_dependency_func)):
             pass
     """
-    signature = inspect.signature(fn)
+    signature = _get_signature(fn)
     dependant = _build_depend_tree(Depends(fn))
+    dependency_names = tuple(
+        dep.name for dep in dependant.dependencies if dep.name is not None
+    )
 
     if inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn):
 
@@ -293,6 +328,7 @@ def inject(fn: Callable[P, T]) -> Callable[P, T]:
             gen = _wrapper_helper(
                 dependant,
                 signature,
+                dependency_names,
                 is_async=True,
                 args=args,
                 kwargs=kwargs,
@@ -345,6 +381,7 @@ def inject(fn: Callable[P, T]) -> Callable[P, T]:
             gen = _wrapper_helper(
                 dependant,
                 signature,
+                dependency_names,
                 is_async=False,
                 args=args,
                 kwargs=kwargs,
@@ -372,6 +409,7 @@ def inject(fn: Callable[P, T]) -> Callable[P, T]:
 
             wrapper = gen_wrapper  # type: ignore[assignment]
 
+    _injected_functions[wrapper] = fn
     return wrapper  # type: ignore[return-value]
 
 
@@ -471,11 +509,23 @@ class Depends(NamedTuple):
     call: DependencyCallable
 
 
+def _return_generator(gen: Any) -> Any:
+    return gen
+
+
+# (async)contextmanager only needs a callable that returns a generator,
+#   so already created generators are wrapped without decorating on every call
+_generator_context_manager = contextmanager(_return_generator)
+_async_generator_context_manager = asynccontextmanager(_return_generator)
+
+
 @dataclass(frozen=True)
 class Provider:
     dependency: DependencyCallable
     is_async: bool
     scope_class: type[ScopeType]
+    scope: ScopeType
+    injected_fn: DependencyCallable | None
 
     @classmethod
     def from_dependency(
@@ -490,14 +540,24 @@ class Provider:
             dependency=dependency,
             is_async=is_async,
             scope_class=scope_class,
+            # Scope instances are never replaced, so resolve it once here
+            #   instead of on every call
+            scope=_scopes[scope_class],
+            injected_fn=_get_injected_fn(dependency),
         )
 
     def get_scope(self) -> ScopeType:
-        return _scopes[self.scope_class]
+        return self.scope
 
-    def resolve_value(self, exit_stack: ExitStack | None, **kwargs: Any) -> Any:
+    def resolve_value(
+        self,
+        exit_stack: ExitStack | None,
+        call: DependencyCallable | None = None,
+        /,
+        **kwargs: Any,
+    ) -> Any:
         scope = self.get_scope()
-        value_or_gen = self.dependency(**kwargs)
+        value_or_gen = (call or self.dependency)(**kwargs)
         if self.is_async:
 
             async def resolve_value_inner() -> Any:
@@ -505,29 +565,28 @@ class Provider:
                 if inspect.iscoroutine(value_or_gen):
                     value_or_gen_ = await value_or_gen_
                 if inspect.isasyncgen(value_or_gen_):
-                    context_manager = asynccontextmanager(
-                        lambda *args, **kwargs: value_or_gen_
-                    )
+                    context_manager = _async_generator_context_manager(value_or_gen_)
                     if isinstance(scope, AutoScope):
                         assert exit_stack is not None, "exit_stack is required"
-                        return await scope.enter(exit_stack, context_manager())
-                    return await scope.enter(context_manager())
+                        return await scope.enter(exit_stack, context_manager)
+                    return await scope.enter(context_manager)
                 return value_or_gen_
 
             return resolve_value_inner()
 
         if inspect.isgenerator(value_or_gen):
-            context_manager = contextmanager(lambda *args, **kwargs: value_or_gen)
+            context_manager = _generator_context_manager(value_or_gen)
             if isinstance(scope, AutoScope):
                 assert exit_stack is not None, "exit_stack is required"
-                return scope.enter(exit_stack, context_manager())
-            return scope.enter(context_manager())
+                return scope.enter(exit_stack, context_manager)
+            return scope.enter(context_manager)
         return value_or_gen
 
 
 def _wrapper_helper(
     dependant: DependNode,
     signature: inspect.Signature,
+    dependency_names: tuple[str, ...],
     is_async: bool,
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
@@ -540,7 +599,7 @@ def _wrapper_helper(
     bound.apply_defaults()
     arguments: dict[str, Any] = bound.arguments
     scopes: list[ScopeType] = []
-    is_root = any(isinstance(value, Depends) for value in bound.arguments.values())
+    is_root = any(isinstance(arguments[name], Depends) for name in dependency_names)
 
     if is_root:
         arguments, scopes = _resolve_dependencies(dependant, exit_stack)
@@ -665,7 +724,7 @@ class DependNode:
 
 
 def _build_depend_tree(dependency: Depends, name: str | None = None) -> DependNode:
-    signature = inspect.signature(dependency.call)
+    signature = _get_signature(dependency.call)
     dependencies = []
     for name_, value in signature.parameters.items():
         param_dep = _extract_and_register_dependency_from_parameter(value)
@@ -710,6 +769,10 @@ class LazyResolver:
         self.provider = provider
         self.kwargs = kwargs or {}
         self.exit_stack = exit_stack
+        # Dependencies of the provider are already in the dependency tree,
+        #   so they can be resolved here without going through `inject` wrapper
+        #   of the provider
+        self.skip_inject = kwargs is not None and provider.injected_fn is not None
 
     def __call__(self, is_async: bool) -> Any:
         call = self._resolve_async if is_async else self._resolve
@@ -717,6 +780,9 @@ class LazyResolver:
 
     def _resolve(self) -> Any:
         scope = self.provider.get_scope()
+        if type(scope) is NullScope and not self.provider.is_async:
+            # NullScope caches nothing, so skip the cache lookups and the lock
+            return self._resolve_value()
         try:
             value = scope.get(self.provider.dependency)
         except KeyError:
@@ -727,14 +793,14 @@ class LazyResolver:
                     try:
                         value = scope.get(self.provider.dependency)
                     except KeyError:
-                        value = self.provider.resolve_value(
-                            self.exit_stack, **self.kwargs
-                        )
+                        value = self._resolve_value()
                         scope.set(self.provider.dependency, value)
         return value
 
     async def _resolve_async(self) -> Any:
         scope = self.provider.get_scope()
+        if type(scope) is NullScope:
+            return await self._resolve_value_async()
         try:
             value = scope.get(self.provider.dependency)
         except KeyError:
@@ -742,8 +808,29 @@ class LazyResolver:
                 try:
                     value = scope.get(self.provider.dependency)
                 except KeyError:
-                    value = self.provider.resolve_value(self.exit_stack, **self.kwargs)
-                    if self.provider.is_async:
-                        value = await value
+                    value = await self._resolve_value_async()
                     scope.set(self.provider.dependency, value)
         return value
+
+    def _resolve_value(self) -> Any:
+        if not self.skip_inject:
+            return self.provider.resolve_value(self.exit_stack, **self.kwargs)
+        kwargs = {
+            name: resolver(is_async=False) for name, resolver in self.kwargs.items()
+        }
+        return self.provider.resolve_value(
+            self.exit_stack, self.provider.injected_fn, **kwargs
+        )
+
+    async def _resolve_value_async(self) -> Any:
+        if not self.provider.is_async:
+            return self._resolve_value()
+        if not self.skip_inject:
+            return await self.provider.resolve_value(self.exit_stack, **self.kwargs)
+        kwargs = {
+            name: await resolver(is_async=True)
+            for name, resolver in self.kwargs.items()
+        }
+        return await self.provider.resolve_value(
+            self.exit_stack, self.provider.injected_fn, **kwargs
+        )
@@ -9,9 +9,6 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Hashable
 
 
-unset = object()
-
-
 class Scope:
     """
     Scopes are used to store and retrieve values by key and for closing dependencies.
@@ -178,31 +175,30 @@ class ContextVarScope(ManualScope):
         self._exit_stack: ContextVar[ExitStack] = ContextVar(
             "picodi_ContextVarScope_exit_stack"
         )
-        self._store: dict[Any, ContextVar[Any]] = {}
+        self._store: ContextVar[dict[Hashable, Any] | None] = ContextVar(
+            "picodi_ContextVarScope_store", default=None
+        )
 
     def get(self, key: Hashable) -> Any:
-        try:
-            value = self._store[key].get()
-        except LookupError:
-            raise KeyError(key) from None
-        if value is unset:
+        store = self._store.get()
+        if store is None:
             raise KeyError(key)
-        return value
+        return store[key]
 
     def set(self, key: Hashable, value: Any) -> None:
-        try:
-            var = self._store[key]
-        except KeyError:
-            var = self._store[key] = ContextVar("picodi_ContextVarScope_var")
-        var.set(value)
+        # Store is copied on write, because child contexts share the same dict
+        #   and values set here must not leak to them (or from them)
+        store = self._store.get()
+        store = {} if store is None else store.copy()
+        store[key] = value
+        self._store.set(store)
 
     def enter(self, context_manager: AsyncContextManager | ContextManager) -> Awaitable:
         exit_stack = self._get_exit_stack()
         return exit_stack.enter_context(context_manager)
 
     def shutdown(self, exc: BaseException | None = None) -> Any:
-        for var in self._store.values():
-            var.set(unset)
+        self._store.set(None)
         exit_stack = self._get_exit_stack()
         return exit_stack.close(exc)
 
@@ -71,29 +71,22 @@ def get_value(path: str, obj: Any, *, default: Any = sentinel) -> Any:
     if not isinstance(path, str):
         raise TypeError("Path must be a string")
 
+    parts = path.split(".")
+
     value = obj
-    current_path = []
-    for part in path.split("."):
-        current_path.append(part)
-        curr_val = _get_attr(value, part)
+    for i, part in enumerate(parts):
+        curr_val = getattr(value, part, sentinel)
         if curr_val is sentinel:
             curr_val = _get_item(value, part)
         if curr_val is sentinel:
             if default is sentinel:
-                raise PathNotFoundError(".".join(current_path), obj)
+                raise PathNotFoundError(".".join(parts[: i + 1]), obj)
             return default
         value = curr_val
 
     return value
 
 
-def _get_attr(obj: Any, attr: str) -> Any:
-    try:
-        return getattr(obj, attr)
-    except AttributeError:
-        return sentinel
-
-
 def _get_item(obj: Any, key: str) -> Any:
     try:
         return obj[key]
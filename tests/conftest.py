@@ -1,6 +1,11 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from pytest_asyncio import is_async_test
 
-from picodi import registry, shutdown_dependencies
+from picodi import SingletonScope, dependency, registry, shutdown_dependencies
 
 pytest_plugins = ["pytester"]
 
@@ -15,6 +20,12 @@ def pytest_addoption(parser):
 
 
 def pytest_collection_modifyitems(config, items):
+    # Run all async tests in one event loop instead of creating a loop per test
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop_marker, append=False)
+
     is_benchmark_run = config.getoption("--run-benchmarks")
     for item in items:
         if is_benchmark_run and "benchmark_test" not in item.keywords:
@@ -34,23 +45,119 @@ async def _cleanup():
     registry.clear()
 
 
+RACE_MAX_THREADS = 16
+
+
+_race_thread = threading.local()
+
+
+@pytest.fixture(scope="session")
+def race_pool():
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    def init_race_thread() -> None:
+        _race_thread.loop = asyncio.new_event_loop()
+        loops.append(_race_thread.loop)
+
+    with ThreadPoolExecutor(
+        max_workers=RACE_MAX_THREADS, initializer=init_race_thread
+    ) as pool:
+        yield pool
+    for loop in loops:
+        loop.close()
+
+
 @pytest.fixture()
-def make_closeable():
-    def maker():
-        class Closeable:
-            def __init__(self, closed: bool = False) -> None:
-                self.is_closed = closed
-                self.close_call_count = 0
+def start_race(race_pool):
+    """
+    Run ``target`` in ``threads_num`` threads, released at the same time.
+    Threads are reused between tests, only the barrier is created per run.
+    """
+
+    def starter(threads_num, target):
+        assert threads_num <= RACE_MAX_THREADS, "not enough threads in the pool"
+        barrier = threading.Barrier(threads_num)
+
+        def run():
+            barrier.wait()
+            target()
+
+        futures = [race_pool.submit(run) for _ in range(threads_num)]
+        for future in futures:
+            future.result()
+
+    return starter
+
+
+@pytest.fixture()
+def run_in_race_loop(race_pool):  # noqa: U100
+    """
+    Run a coroutine in the event loop of the current race thread.
+    Every pool thread has its own loop, created once per session.
+    """
+
+    def runner(coro):
+        return _race_thread.loop.run_until_complete(coro)
+
+    return runner
 
-            def close(self) -> None:
-                self.close_call_count += 1
-                self.is_closed = True
 
-        return Closeable()
+class Counters:
+    __slots__ = ("init", "close")
 
-    return maker
+    def __init__(self):
+        self.init = 0
+        self.close = 0
+
+
+@pytest.fixture()
+def counters():
+    return Counters()
+
+
+class Closeable:
+    __slots__ = ("is_closed", "close_call_count")
+
+    def __init__(self, closed: bool = False) -> None:
+        self.is_closed = closed
+        self.close_call_count = 0
+
+    def close(self) -> None:
+        self.close_call_count += 1
+        self.is_closed = True
+
+
+@pytest.fixture()
+def make_closeable():
+    return Closeable
 
 
 @pytest.fixture()
 def closeable(make_closeable):
     return make_closeable()
+
+
+@pytest.fixture()
+def resource():
+    counters = Counters()
+
+    @dependency(scope_class=SingletonScope)
+    def my_resource():
+        counters.init += 1
+        yield counters
+        counters.close += 1
+
+    return counters, my_resource
+
+
+@pytest.fixture()
+def async_resource():
+    counters = Counters()
+
+    @dependency(scope_class=SingletonScope)
+    async def my_resource():
+        counters.init += 1
+        yield counters
+        counters.close += 1
+
+    return counters, my_resource
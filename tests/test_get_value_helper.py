@@ -7,54 +7,48 @@ from picodi.helpers import PathNotFoundError, get_value
 SN = SimpleNamespace
 
 
-@pytest.mark.parametrize(
-    "path,obj,expected",
-    [
-        ("foo", SN(foo=42), 42),
-        ("foo.bar", SN(foo=SN(bar=101)), 101),
-        ("foo.bar.baz", SN(foo=SN(bar=SN(baz=12))), 12),
-        #
-        ("foo", {"foo": 42}, 42),
-        ("foo.bar", {"foo": {"bar": 101}}, 101),
-        ("foo.bar.baz", {"foo": {"bar": {"baz": 12}}}, 12),
-        #
-        ("foo.bar", SN(foo={"bar": 101}), 101),
-        ("foo.bar", {"foo": SN(bar=101)}, 101),
-        ("foo.bar.baz", SN(foo={"bar": SN(baz=12)}), 12),
-        ("foo.bar.baz", {"foo": SN(bar={"baz": 12})}, 12),
-    ],
+SIMPLE_VALUE_CASES = (
+    ("foo", SN(foo=42), 42),
+    ("foo.bar", SN(foo=SN(bar=101)), 101),
+    ("foo.bar.baz", SN(foo=SN(bar=SN(baz=12))), 12),
+    #
+    ("foo", {"foo": 42}, 42),
+    ("foo.bar", {"foo": {"bar": 101}}, 101),
+    ("foo.bar.baz", {"foo": {"bar": {"baz": 12}}}, 12),
+    #
+    ("foo.bar", SN(foo={"bar": 101}), 101),
+    ("foo.bar", {"foo": SN(bar=101)}, 101),
+    ("foo.bar.baz", SN(foo={"bar": SN(baz=12)}), 12),
+    ("foo.bar.baz", {"foo": SN(bar={"baz": 12})}, 12),
 )
-def test_get_simple_value(path, obj, expected):
-    result = get_value(path, obj)
 
-    assert result == expected
+NOT_EXISTING_PATH_CASES = (
+    ("oops", SN(foo=42), "oops"),
+    ("foo.bar", SN(foo=42), "foo.bar"),
+    ("foo.bar.baz", SN(foo=SN(bar=101)), "foo.bar.baz"),
+    ("foo.ban", SN(foo=SN(bar=101)), "foo.ban"),
+)
 
 
-@pytest.mark.parametrize(
-    "path,obj",
-    [
-        ("oops", SN(foo=42)),
-        ("foo.bar", SN(foo=42)),
-        ("foo.bar.baz", SN(foo=SN(bar=101))),
-    ],
-)
-def test_not_existing_path_raises_error(path, obj):
-    with pytest.raises(PathNotFoundError):
-        get_value(path, obj)
+def test_get_simple_value():
+    for path, obj, expected in SIMPLE_VALUE_CASES:
+        result = get_value(path, obj)
 
+        assert result == expected, (path, obj)
 
-@pytest.mark.parametrize(
-    "path,obj,expected_path",
-    [
-        ("oops", SN(foo=42), "oops"),
-        ("foo.bar", SN(foo=42), "foo.bar"),
-        ("foo.bar.baz", SN(foo=SN(bar=101)), "foo.bar.baz"),
-        ("foo.ban", SN(foo=SN(bar=101)), "foo.ban"),
-    ],
-)
-def test_not_existing_path_raises_error_with_proper_message(path, obj, expected_path):
-    with pytest.raises(PathNotFoundError, match=f"Can't find path '{expected_path}'"):
-        get_value(path, obj)
+
+def test_not_existing_path_raises_error():
+    for path, obj, _ in NOT_EXISTING_PATH_CASES:
+        with pytest.raises(PathNotFoundError):
+            get_value(path, obj)
+
+
+def test_not_existing_path_raises_error_with_proper_message():
+    for path, obj, expected_path in NOT_EXISTING_PATH_CASES:
+        with pytest.raises(
+            PathNotFoundError, match=f"Can't find path '{expected_path}'"
+        ):
+            get_value(path, obj)
 
 
 @pytest.mark.parametrize(
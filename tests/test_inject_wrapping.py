@@ -1,6 +1,7 @@
+import functools
 import inspect
 
-from picodi import Provide, inject
+from picodi import Provide, _picodi, inject
 
 
 def get_value():
@@ -40,3 +41,47 @@ def test_inject_doesnt_change_type_of_async_generator():
         yield value  # pragma: no cover
 
     assert inspect.isasyncgenfunction(my_dependency)
+
+
+def test_user_wrapper_of_injected_dependency_is_not_skipped():
+    def get_42():
+        return 42
+
+    @inject
+    def get_number(number: int = Provide(get_42)):
+        return number
+
+    @functools.wraps(get_number)
+    def get_number_plus_one(*args, **kwargs):
+        return get_number(*args, **kwargs) + 1
+
+    @inject
+    def service(number: int = Provide(get_number_plus_one)):
+        return number
+
+    assert service() == 43
+
+
+def test_inject_wrapper_of_nested_dependency_is_skipped(monkeypatch):
+    wrapper_helper_calls = []
+    wrapper_helper = _picodi._wrapper_helper
+
+    def counting_wrapper_helper(dependant, *args, **kwargs):
+        wrapper_helper_calls.append(dependant.value.call)
+        return wrapper_helper(dependant, *args, **kwargs)
+
+    monkeypatch.setattr(_picodi, "_wrapper_helper", counting_wrapper_helper)
+
+    def get_transitive():
+        return 42
+
+    @inject
+    def get_in_use(number: int = Provide(get_transitive)):
+        return number
+
+    @inject
+    def service(number: int = Provide(get_in_use)):
+        return number
+
+    assert service() == 42
+    assert wrapper_helper_calls == [service.__wrapped__]
@@ -3,19 +3,59 @@ from __future__ import annotations
 import contextlib
 
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+
+async def _app_not_set(scope, receive, send):  # noqa: U100
+    raise RuntimeError("ASGI app is not set, use `make_asgi_client` fixture")
+
+
+@pytest.fixture(scope="session")
+def test_server_url():
+    return "http://test"
+
+
+@pytest.fixture(scope="module")
+def _dependencies_for_init():
+    return []
 
 
 @pytest.fixture()
-async def make_asgi_client(test_server_url):
-    @contextlib.asynccontextmanager
-    async def maker(app):
-        async with AsyncClient(app=app, base_url=test_server_url, timeout=2) as client:
-            yield client
+def dependencies_for_init(_dependencies_for_init):
+    """
+    Dependencies initialized by ``RequestScopeMiddleware`` of the module-scoped app.
+    """
+    yield _dependencies_for_init
+    _dependencies_for_init.clear()
 
-    return maker
+
+@pytest.fixture(scope="session")
+def asgi_transport():
+    return ASGITransport(app=_app_not_set)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def asgi_client(asgi_transport, test_server_url):
+    async with AsyncClient(
+        transport=asgi_transport, base_url=test_server_url, timeout=2
+    ) as client:
+        yield client
 
 
 @pytest.fixture()
-def test_server_url():
-    return "http://test"
+def make_asgi_client(asgi_transport, asgi_client):
+    """
+    Point the shared session client to the given app.
+    Client and transport are created once per session, only the app is swapped.
+    """
+
+    @contextlib.asynccontextmanager
+    async def maker(app):
+        asgi_transport.app = app
+        try:
+            yield asgi_client
+        finally:
+            asgi_transport.app = _app_not_set
+
+    return maker
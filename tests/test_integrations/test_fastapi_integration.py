@@ -6,7 +6,6 @@ from fastapi.exceptions import FastAPIError
 from starlette.middleware import Middleware
 
 from picodi import (
-    InitDependencies,
     SingletonScope,
     dependency,
     inject,
@@ -16,17 +15,26 @@ from picodi import (
 from picodi.integrations.fastapi import Provide, RequestScope, RequestScopeMiddleware
 
 
-@pytest.fixture()
-def make_app():
-    def maker(dependencies_for_init: InitDependencies | None = None):
-        kwargs = {}
-        if dependencies_for_init:
-            kwargs["dependencies_for_init"] = dependencies_for_init
-        return FastAPI(
-            middleware=[Middleware(RequestScopeMiddleware, **kwargs)],
-        )
+@pytest.fixture(scope="module")
+def app(_dependencies_for_init):
+    return FastAPI(
+        middleware=[
+            Middleware(
+                RequestScopeMiddleware,
+                dependencies_for_init=lambda: _dependencies_for_init,
+            )
+        ],
+    )
+
 
-    return maker
+@pytest.fixture(scope="module")
+def bare_app():
+    return FastAPI(middleware=[Middleware(RequestScopeMiddleware)])
+
+
+@pytest.fixture()
+def path(request):
+    return f"/{request.node.name}"
 
 
 class MyNumber:
@@ -34,97 +42,82 @@ class MyNumber:
         self.value = number
 
 
-def test_fastapi_cant_use_provide_as_is(make_app):
-    app = make_app()
+FORTY_TWO = MyNumber(42)
+
+
+def get_42() -> MyNumber:
+    return FORTY_TWO
 
-    def get_42() -> MyNumber:
-        return MyNumber(42)  # pragma: no cover
 
+DEPENDS_42 = Depends(Provide(get_42))
+PROVIDE_42_WRAPPED = Provide(get_42, wrap=True)
+
+
+def root_without_inject_decorator(number: MyNumber = PROVIDE_42_WRAPPED):
+    return {"number": number.value}
+
+
+def test_fastapi_cant_use_provide_as_is(app, path):
     with pytest.raises(FastAPIError, match="Invalid args for response field"):
 
-        @app.get("/")  # pragma: no cover
+        @app.get(path)  # pragma: no cover
         @inject
         async def root(number: MyNumber = Provide(get_42)):
             return {"number": number}  # pragma: no cover
 
 
-async def test_resolve_dependency_in_route(make_app, make_asgi_client):
-    app = make_app()
-
-    def get_42() -> MyNumber:
-        return MyNumber(42)
-
-    @app.get("/")
+async def test_resolve_dependency_in_route(app, path, make_asgi_client):
+    @app.get(path)
     @inject
-    def root(number: MyNumber = Depends(Provide(get_42))):
+    def root(number: MyNumber = DEPENDS_42):
         return {"number": number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert response.json() == {"number": 42}
 
 
 async def test_resolve_dependency_in_route_only_with_provide(
-    make_app, make_asgi_client
+    app, path, make_asgi_client
 ):
-    app = make_app()
-
-    def get_42() -> MyNumber:
-        return MyNumber(42)
-
-    @app.get("/")
+    @app.get(path)
     @inject
-    def root(number: MyNumber = Provide(get_42, wrap=True)):
+    def root(number: MyNumber = PROVIDE_42_WRAPPED):
         return {"number": number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert response.json() == {"number": 42}
 
 
 async def test_resolve_dependency_in_route_without_inject_decorator(
-    make_app, make_asgi_client
+    app, path, make_asgi_client
 ):
-    app = make_app()
-
-    def get_42() -> MyNumber:
-        return MyNumber(42)
-
-    @app.get("/")
-    def root(number: MyNumber = Provide(get_42, wrap=True)):
-        return {"number": number.value}
+    app.add_api_route(path, root_without_inject_decorator, methods=["GET"])
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert response.json() == {"number": 42}
 
 
 async def test_can_override_deps_passed_to_fastapi_view_without_inject_decorator(
-    make_app, make_asgi_client
+    app, path, make_asgi_client
 ):
-    app = make_app()
-
-    def get_42() -> MyNumber:
-        return MyNumber(42)
-
-    @app.get("/")
-    def root(number: MyNumber = Provide(get_42, wrap=True)):
-        return {"number": number.value}
+    app.add_api_route(path, root_without_inject_decorator, methods=["GET"])
 
     with registry.override(get_42, lambda: MyNumber(24)):
         async with make_asgi_client(app) as asgi_client:
-            response = await asgi_client.get("/")
+            response = await asgi_client.get(path)
 
     assert response.json() == {"number": 24}
 
 
 async def test_dependency_scope_close_only_after_view_is_exited(
-    make_app, make_asgi_client
+    app, path, make_asgi_client
 ):
-    app = make_app()
     closed = 0
 
     def get_42():
@@ -132,22 +125,21 @@ async def test_dependency_scope_close_only_after_view_is_exited(
         nonlocal closed
         closed += 1
 
-    @app.get("/")
+    @app.get(path)
     def root(number: MyNumber = Provide(get_42, wrap=True)):
         assert closed == 0
         return {"number": number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert closed == 1
     assert response.json() == {"number": 42}
 
 
 async def test_singleton_dependency_scope_not_closed_after_view_is_exited(
-    make_app, make_asgi_client
+    app, path, make_asgi_client
 ):
-    app = make_app()
     closed = 0
 
     @dependency(scope_class=SingletonScope)
@@ -156,13 +148,13 @@ async def test_singleton_dependency_scope_not_closed_after_view_is_exited(
         nonlocal closed
         closed += 1
 
-    @app.get("/")
+    @app.get(path)
     def root(number: MyNumber = Provide(get_42, wrap=True)):
         assert closed == 0
         return {"number": number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert closed == 0
     await shutdown_dependencies()
@@ -170,26 +162,22 @@ async def test_singleton_dependency_scope_not_closed_after_view_is_exited(
     assert response.json() == {"number": 42}
 
 
-async def test_resolve_dependency_in_route_async(make_app, make_asgi_client):
-    app = make_app()
-
+async def test_resolve_dependency_in_route_async(app, path, make_asgi_client):
     async def get_42() -> MyNumber:
         return MyNumber(42)
 
-    @app.get("/")
+    @app.get(path)
     @inject
     async def root(number: MyNumber = Depends(Provide(get_42))):
         return {"number": number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert response.json() == {"number": 42}
 
 
-async def test_resolve_mixed_dependency_in_route(make_app, make_asgi_client):
-    app = make_app()
-
+async def test_resolve_mixed_dependency_in_route(app, path, make_asgi_client):
     async def get_42() -> MyNumber:
         return MyNumber(42)
 
@@ -199,21 +187,19 @@ async def test_resolve_mixed_dependency_in_route(make_app, make_asgi_client):
     ) -> dict[str, int]:
         return {slug: number.value}
 
-    @app.get("/")
+    @app.get(path)
     async def root(slug_result: dict[str, int] = Depends(get_by_slug)):
         return slug_result
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/", params={"slug": "meaning-of-life"})
+        response = await asgi_client.get(path, params={"slug": "meaning-of-life"})
 
     assert response.json() == {"meaning-of-life": 42}
 
 
 async def test_can_use_provide_in_nested_deps_without_depends(
-    make_app, make_asgi_client
+    app, path, make_asgi_client
 ):
-    app = make_app()
-
     async def get_42() -> int:
         return 42
 
@@ -231,7 +217,7 @@ async def test_can_use_provide_in_nested_deps_without_depends(
     ) -> StringNumber:
         return StringNumber(number)
 
-    @app.get("/")
+    @app.get(path)
     @inject
     async def root(
         string_number: StringNumber = Depends(Provide(get_number_as_string)),
@@ -239,81 +225,85 @@ async def test_can_use_provide_in_nested_deps_without_depends(
         return {"nested": string_number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert response.json() == {"nested": "42"}
 
 
-async def test_resolve_annotated_dependency(make_app, make_asgi_client):
-    app = make_app()
-
-    def get_42() -> MyNumber:
-        return MyNumber(42)
-
-    @app.get("/")
+async def test_resolve_annotated_dependency(app, path, make_asgi_client):
+    @app.get(path)
     @inject
-    def root(number: Annotated[MyNumber, Depends(Provide(get_42))]):
+    def root(number: Annotated[MyNumber, DEPENDS_42]):
         return {"number": number.value}
 
     async with make_asgi_client(app) as asgi_client:
-        response = await asgi_client.get("/")
+        response = await asgi_client.get(path)
 
     assert response.json() == {"number": 42}
 
 
-async def test_middleware_init_and_shutdown_request_scope(make_app, make_asgi_client):
-    init_counter = 0
-    closing_counter = 0
+async def test_middleware_init_and_shutdown_request_scope(
+    app, path, dependencies_for_init, make_asgi_client, counters
+):
+    @dependency(scope_class=RequestScope)
+    async def get_42_async():
+        counters.init += 1
+        yield 42
+        counters.close += 1
 
     @dependency(scope_class=RequestScope)
-    async def get_42():
-        nonlocal init_counter
-        init_counter += 1
+    def get_42_sync():
+        counters.init += 1
         yield 42
-        nonlocal closing_counter
-        closing_counter += 1
+        counters.close += 1
 
-    app = make_app([get_42])
+    @app.get(f"{path}/async")
+    @inject
+    async def async_root():
+        assert counters.init == 1
+        assert counters.close == 0
+        return {}
 
-    @app.get("/")
+    @app.get(f"{path}/sync")
     @inject
-    async def root():
-        assert init_counter == 1
-        assert closing_counter == 0
+    def sync_root():
+        assert counters.init == 2
+        assert counters.close == 1
         return {}
 
     async with make_asgi_client(app) as asgi_client:
-        await asgi_client.get("/")
+        dependencies_for_init[:] = [get_42_async]
+        await asgi_client.get(f"{path}/async")
 
-    assert init_counter == 1
-    assert closing_counter == 1
+        assert counters.init == 1
+        assert counters.close == 1
 
+        dependencies_for_init[:] = [get_42_sync]
+        await asgi_client.get(f"{path}/sync")
 
-async def test_middleware_init_and_shutdown_request_scope_sync(
-    make_app, make_asgi_client
-):
-    init_counter = 0
-    closing_counter = 0
+    assert counters.init == 2
+    assert counters.close == 2
 
-    @dependency(scope_class=RequestScope)
-    def get_42():
-        nonlocal init_counter
-        init_counter += 1
-        yield 42
-        nonlocal closing_counter
-        closing_counter += 1
 
-    app = make_app([get_42])
+async def test_middleware_without_dependencies_for_init_closes_request_scope(
+    bare_app, path, make_asgi_client, counters
+):
+    @dependency(scope_class=RequestScope)
+    async def get_42():
+        counters.init += 1
+        yield MyNumber(42)
+        counters.close += 1
 
-    @app.get("/")
+    @bare_app.get(path)
     @inject
-    def root():
-        assert init_counter == 1
-        assert closing_counter == 0
-        return {}
+    async def root(number: MyNumber = Depends(Provide(get_42))):
+        assert counters.init == 1
+        assert counters.close == 0
+        return {"number": number.value}
 
-    async with make_asgi_client(app) as asgi_client:
-        await asgi_client.get("/")
+    async with make_asgi_client(bare_app) as asgi_client:
+        response = await asgi_client.get(path)
 
-    assert init_counter == 1
-    assert closing_counter == 1
+    assert response.json() == {"number": 42}
+    assert counters.init == 1
+    assert counters.close == 1
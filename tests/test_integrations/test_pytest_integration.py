@@ -1,14 +1,59 @@
 import pytest
 
+pytestmark = pytest.mark.slow
 
-def test_can_override_deps_with_marker(pytester):
+INVALID_OVERRIDE_MARKER_ARGUMENTS_SRC = """
+import pytest
+
+@pytest.mark.picodi_override(1, 2, 3)
+def test_more_than_2_arguments():
+    assert True
+
+@pytest.mark.picodi_override({})
+def test_single_argument_not_list_or_tuple():
+    assert True
+"""
+
+NOT_CALLABLE_OVERRIDE_SRC_TEMPLATE = """
+import pytest
+
+@pytest.mark.picodi_override({dep}, {override})
+def test_hello_default():
+    assert True
+"""
+NOT_CALLABLE_OVERRIDE_SOURCES = [
+    pytest.param(
+        NOT_CALLABLE_OVERRIDE_SRC_TEMPLATE.format(dep=dep, override=override),
+        id=id_,
+    )
+    for id_, dep, override in [
+        ("dependency", "'not_callable'", "lambda: 42"),
+        ("override", "lambda: 42", "'not_callable'"),
+        ("both", "'not_callable'", "'not_callable'"),
+    ]
+]
+
+
+@pytest.fixture()
+def picodi_pytester(pytester):
     pytester.makeconftest(
         """
         pytest_plugins = ["picodi.integrations._pytest"]
     """
     )
+    return pytester
 
-    pytester.makepyfile(
+
+def failure_messages(reprec):
+    return "".join(
+        report.longreprtext
+        for report in reprec.getreports("pytest_runtest_logreport")
+        if report.failed
+    )
+
+
+def test_can_override_deps_with_marker(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject
@@ -31,23 +76,14 @@ def test_can_override_deps_with_marker(pytester):
     """
     )
 
-    result = pytester.runpytest()
+    result = picodi_pytester.runpytest()
 
     result.assert_outcomes(passed=1)
 
 
 def test_can_override_deps_with_marker_async(pytester):
-    pytester.makepyprojecttoml(
-        """
-        [tool.coverage.run]
-        branch = true
-    """
-    )
-
     pytester.makeconftest(
         """
-        import coverage
-        coverage.process_startup()
         pytest_plugins = [
             "picodi.integrations._pytest",
             "picodi.integrations._pytest_asyncio",
@@ -79,19 +115,13 @@ def test_can_override_deps_with_marker_async(pytester):
     """
     )
 
-    result = pytester.runpytest_subprocess()
+    result = pytester.runpytest()
 
     result.assert_outcomes(passed=1)
 
 
-def test_can_override_multiple_deps_with_marker(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
+def test_can_override_multiple_deps_with_marker(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject
@@ -128,19 +158,13 @@ def test_can_override_multiple_deps_with_marker(pytester):
     """
     )
 
-    result = pytester.runpytest()
+    result = picodi_pytester.runpytest()
 
     result.assert_outcomes(passed=1)
 
 
-def test_can_override_with_fixture(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
+def test_can_override_with_fixture(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject
@@ -167,93 +191,32 @@ def test_can_override_with_fixture(pytester):
     """
     )
 
-    result = pytester.runpytest()
+    result = picodi_pytester.runpytest()
 
     result.assert_outcomes(passed=1)
 
 
-def test_cant_add_more_tan_2_arguments_to_marker(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
+def test_override_marker_validates_arguments(picodi_pytester):
+    picodi_pytester.makepyfile(INVALID_OVERRIDE_MARKER_ARGUMENTS_SRC)
 
-    pytester.makepyfile(
-        """
-        import pytest
+    reprec = picodi_pytester.inline_run()
 
-        @pytest.mark.picodi_override(1, 2, 3)
-        def test_hello_default():
-            assert True
-    """
-    )
+    errors = failure_messages(reprec)
+    assert "marker must have 2 arguments" in errors
+    assert "Overrides must be a list or tuple" in errors
 
-    result = pytester.runpytest()
 
-    assert "marker must have 2 arguments" in "".join(result.outlines)
+@pytest.mark.parametrize("source", NOT_CALLABLE_OVERRIDE_SOURCES)
+def test_dependencies_and_overrides_must_be_callable(picodi_pytester, source):
+    picodi_pytester.makepyfile(source)
 
+    reprec = picodi_pytester.inline_run()
 
-def test_single_argument_cant_be_not_list_or_tuple(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
+    assert "Dependency and override must be callable" in failure_messages(reprec)
 
-    pytester.makepyfile(
-        """
-        import pytest
 
-        @pytest.mark.picodi_override({})
-        def test_hello_default():
-            assert True
-    """
-    )
-
-    result = pytester.runpytest()
-
-    assert "Overrides must be a list or tuple" in "".join(result.outlines)
-
-
-@pytest.mark.parametrize(
-    "dep,override",
-    [
-        ("'not_callable'", "lambda: 42"),
-        ("lambda: 42", "'not_callable'"),
-        ("'not_callable'", "'not_callable'"),
-    ],
-)
-def test_dependencies_and_overrides_must_be_callable(pytester, dep, override):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
-        f"""
-        import pytest
-
-        @pytest.mark.picodi_override({dep}, {override})
-        def test_hello_default():
-            assert True
-    """
-    )
-
-    result = pytester.runpytest()
-
-    assert "Dependency and override must be callable" in "".join(result.outlines)
-
-
-def test_can_init_dependencies_with_marker(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
+def test_can_init_dependencies_with_marker(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject, dependency, SingletonScope
@@ -278,23 +241,14 @@ def test_can_init_dependencies_with_marker(pytester):
     """
     )
 
-    result = pytester.runpytest()
+    result = picodi_pytester.runpytest()
 
     result.assert_outcomes(passed=1)
 
 
 def test_can_init_dependencies_with_marker_async(pytester):
-    pytester.makepyprojecttoml(
-        """
-        [tool.coverage.run]
-        branch = true
-    """
-    )
-
     pytester.makeconftest(
         """
-        import coverage
-        coverage.process_startup()
         pytest_plugins = [
             "picodi.integrations._pytest",
             "picodi.integrations._pytest_asyncio",
@@ -327,19 +281,13 @@ def test_can_init_dependencies_with_marker_async(pytester):
     """
     )
 
-    result = pytester.runpytest_subprocess()
+    result = pytester.runpytest()
 
     result.assert_outcomes(passed=1)
 
 
-def test_cant_use_init_dependencies_with_args(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
+def test_cant_use_init_dependencies_with_args(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject, dependency, SingletonScope
@@ -351,19 +299,13 @@ def test_cant_use_init_dependencies_with_args(pytester):
     """
     )
 
-    result = pytester.runpytest()
+    result = picodi_pytester.runpytest()
 
     assert "marker don't support positional arguments" in "".join(result.outlines)
 
 
-def test_cant_use_init_dependencies_without_kwargs(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
+def test_cant_use_init_dependencies_without_kwargs(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject, dependency, SingletonScope
@@ -375,19 +317,13 @@ def test_cant_use_init_dependencies_without_kwargs(pytester):
     """
     )
 
-    result = pytester.runpytest()
+    result = picodi_pytester.runpytest()
 
     assert "marker must have keyword arguments" in "".join(result.outlines)
 
 
-def test_fixtures_executes_in_strict_order(pytester):
-    pytester.makeconftest(
-        """
-        pytest_plugins = ["picodi.integrations._pytest"]
-    """
-    )
-
-    pytester.makepyfile(
+def test_fixtures_executes_in_strict_order(picodi_pytester):
+    picodi_pytester.makepyfile(
         """
         import pytest
         from picodi import Provide, inject, dependency, SingletonScope
@@ -412,6 +348,6 @@ def test_fixtures_executes_in_strict_order(pytester):
     """
     )
 
-    result = pytester.runpytest("-vv")
+    result = picodi_pytester.runpytest("-vv")
 
     result.assert_outcomes(passed=1)
@@ -1,90 +1,66 @@
 import pytest
 
-from picodi import SingletonScope, dependency
 from picodi.helpers import lifespan
 
+SYNC_DECORATORS = [lifespan, lifespan.sync]
+ASYNC_DECORATORS = [lifespan, lifespan.async_]
 
-@pytest.fixture()
-def resource():
-    state = {"inited": False, "closed": False}
 
-    @dependency(scope_class=SingletonScope)
-    def my_resource():
-        state["inited"] = True
-        yield state
-        state["closed"] = True
-
-    return state, my_resource
-
-
-@pytest.fixture()
-def async_resource():
-    state = {"inited": False, "closed": False}
-
-    @dependency(scope_class=SingletonScope)
-    async def my_resource():
-        state["inited"] = True
-        yield state
-        state["closed"] = True
-
-    return state, my_resource
-
-
-@pytest.mark.parametrize("decorator", [lifespan, lifespan.sync])
+@pytest.mark.parametrize("decorator", SYNC_DECORATORS)
 def test_can_init_and_shutdown_sync(resource, decorator):
-    state, dep = resource
+    counters, dep = resource
 
     @decorator(dependencies_for_init=[dep])
     def service():
-        assert state["inited"] is True
-        assert state["closed"] is False
+        assert counters.init == 1
+        assert counters.close == 0
 
     service()
 
-    assert state["inited"] is True
-    assert state["closed"] is True
+    assert counters.init == 1
+    assert counters.close == 1
 
 
-@pytest.mark.parametrize("decorator", [lifespan, lifespan.async_])
+@pytest.mark.parametrize("decorator", ASYNC_DECORATORS)
 async def test_can_init_and_shutdown_async(async_resource, decorator):
-    state, dep = async_resource
+    counters, dep = async_resource
 
     @decorator(dependencies_for_init=[dep])
     async def service():
-        assert state["inited"] is True
-        assert state["closed"] is False
+        assert counters.init == 1
+        assert counters.close == 0
 
     await service()
 
-    assert state["inited"] is True
-    assert state["closed"] is True
+    assert counters.init == 1
+    assert counters.close == 1
 
 
 def test_can_init_and_shutdown_sync_as_context_manager(resource):
-    state, dep = resource
+    counters, dep = resource
 
     with lifespan.sync(dependencies_for_init=[dep]):
-        assert state["inited"] is True
-        assert state["closed"] is False
+        assert counters.init == 1
+        assert counters.close == 0
 
-    assert state["inited"] is True
-    assert state["closed"] is True
+    assert counters.init == 1
+    assert counters.close == 1
 
 
 async def test_can_init_and_shutdown_async_as_context_manager(async_resource):
-    state, dep = async_resource
+    counters, dep = async_resource
 
     async with lifespan.async_(dependencies_for_init=[dep]):
-        assert state["inited"] is True
-        assert state["closed"] is False
+        assert counters.init == 1
+        assert counters.close == 0
 
-    assert state["inited"] is True
-    assert state["closed"] is True
+    assert counters.init == 1
+    assert counters.close == 1
 
 
-@pytest.mark.parametrize("decorator", [lifespan, lifespan.sync])
+@pytest.mark.parametrize("decorator", SYNC_DECORATORS)
 def test_skip_initialization(resource, decorator):
-    state, dep = resource
+    counters, dep = resource
 
     @decorator(dependencies_for_init=None)
     def service():
@@ -92,12 +68,12 @@ def test_skip_initialization(resource, decorator):
 
     service()
 
-    assert state["inited"] is False
+    assert counters.init == 0
 
 
-@pytest.mark.parametrize("decorator", [lifespan, lifespan.async_])
+@pytest.mark.parametrize("decorator", ASYNC_DECORATORS)
 async def test_skip_initialization_async(async_resource, decorator):
-    state, dep = async_resource
+    counters, dep = async_resource
 
     @decorator(dependencies_for_init=None)
     async def service():
@@ -105,12 +81,12 @@ async def test_skip_initialization_async(async_resource, decorator):
 
     await service()
 
-    assert state["inited"] is False
+    assert counters.init == 0
 
 
-@pytest.mark.parametrize("decorator", [lifespan, lifespan.sync])
+@pytest.mark.parametrize("decorator", SYNC_DECORATORS)
 def test_skip_shutdown(resource, decorator):
-    state, dep = resource
+    counters, dep = resource
 
     @decorator(dependencies_for_init=[dep], shutdown_scope_class=None)
     def service():
@@ -118,13 +94,13 @@ def test_skip_shutdown(resource, decorator):
 
     service()
 
-    assert state["inited"] is True
-    assert state["closed"] is False
+    assert counters.init == 1
+    assert counters.close == 0
 
 
-@pytest.mark.parametrize("decorator", [lifespan, lifespan.async_])
+@pytest.mark.parametrize("decorator", ASYNC_DECORATORS)
 async def test_skip_shutdown_async(async_resource, decorator):
-    state, dep = async_resource
+    counters, dep = async_resource
 
     @decorator(dependencies_for_init=[dep], shutdown_scope_class=None)
     async def service():
@@ -132,5 +108,5 @@ async def test_skip_shutdown_async(async_resource, decorator):
 
     await service()
 
-    assert state["inited"] is True
-    assert state["closed"] is False
+    assert counters.init == 1
+    assert counters.close == 0
@@ -318,3 +318,23 @@ def test_can_override_deeply_nested_dep():
         result = my_service()
 
     assert result == 42
+
+
+def test_can_override_with_not_weak_referenceable_callable():
+    class GetNumber:
+        __slots__ = ()
+
+        def __call__(self):
+            return 42
+
+    def get_number():
+        return 1  # pragma: no cover
+
+    @inject
+    def my_service(number: int = Provide(get_number)):
+        return number
+
+    with registry.override(get_number, GetNumber()):
+        result = my_service()
+
+    assert result == 42
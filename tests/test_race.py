@@ -1,4 +1,3 @@
-import asyncio
 from random import randint
 
 import pytest
@@ -27,7 +26,7 @@ def test_scope_resolving_races(start_race):
 
 
 @pytest.mark.repeat(5)
-def test_scope_resolving_races_async(start_race):
+def test_scope_resolving_races_async(start_race, run_in_race_loop):
     @dependency(scope_class=SingletonScope)
     async def get_random_int():
         return randint(1, 10000)
@@ -42,7 +41,7 @@ def test_scope_resolving_races_async(start_race):
         results.append(await service())
 
     def actual_test():
-        asyncio.run(main())
+        run_in_race_loop(main())
 
     start_race(threads_num=8, target=actual_test)
 
@@ -47,6 +47,20 @@ async def test_values_cant_be_retrieved_from_separate_task(sut):
     await asyncio.gather(task1(), task2())
 
 
+async def test_values_set_in_child_task_dont_leak_to_parent(sut):
+    sut.set("a", 1)
+
+    async def child():
+        sut.set("b", 2)
+        sut.set("a", 3)
+
+    await asyncio.create_task(child())
+
+    assert sut.get("a") == 1
+    with pytest.raises(KeyError):
+        sut.get("b")
+
+
 async def test_shutdown_from_one_task_dont_affect_another_task(sut):
     value_set = asyncio.Event()
     scope_shutdown = asyncio.Event()
@@ -17,6 +17,41 @@ def test_scope_not_store_anything(sut):
         sut.get("key")
 
 
+class CachingNullScope(NullScope):
+    def __init__(self):
+        self._store: dict = {}
+
+    def get(self, key):
+        return self._store[key]
+
+    def set(self, key, value):
+        self._store[key] = value
+
+
+def test_subclass_of_null_scope_can_cache_values():
+    @dependency(scope_class=CachingNullScope)
+    def get_object():
+        return object()
+
+    @inject
+    def service(obj: object = Provide(get_object)):
+        return obj
+
+    assert service() is service()
+
+
+async def test_subclass_of_null_scope_can_cache_values_async():
+    @dependency(scope_class=CachingNullScope)
+    async def get_object():
+        return object()
+
+    @inject
+    async def service(obj: object = Provide(get_object)):
+        return obj
+
+    assert await service() is await service()
+
+
 async def test_closing_one_dependency_dont_affect_another(make_closeable):
     closeables = [make_closeable() for _ in range(2)]
     closeable_gen = iter(closeables)
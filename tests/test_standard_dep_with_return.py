@@ -1,10 +1,13 @@
 import inspect
 import random
+import re
 
 import pytest
 
 from picodi import Provide, SingletonScope, dependency, init_dependencies, inject
 
+REDIS_STRING_RE = re.compile(r"http://redis:(\d+)")
+
 
 def get_random_int():
     return random.randint(1, 100_000)
@@ -41,22 +44,23 @@ def get_sync_dependency_in_async_context_dep():
     return get_sync_dependency_in_async_context
 
 
+ASYNC_REDIS_STRING_DEPS = [
+    pytest.param("get_redis_string_async_dep", id="async"),
+    pytest.param("get_sync_dependency_in_async_context_dep", id="sync-in-async"),
+]
+
+
 def test_resolve_sync_dependency(get_redis_string_dep):
     result = get_redis_string_dep()
 
     _check_redis_string(result)
 
 
-async def test_resolve_async_dependency(get_redis_string_async_dep):
-    result = await get_redis_string_async_dep()
-
-    _check_redis_string(result)
+@pytest.mark.parametrize("dep_name", ASYNC_REDIS_STRING_DEPS)
+async def test_resolve_async_dependency(request, dep_name):
+    func = request.getfixturevalue(dep_name)
 
-
-async def test_resolve_sync_dependency_in_async_function(
-    get_sync_dependency_in_async_context_dep,
-):
-    result = await get_sync_dependency_in_async_context_dep()
+    result = await func()
 
     _check_redis_string(result)
 
@@ -70,16 +74,12 @@ def test_resolve_dependency_multiple_times_return_different_results(
     _check_redis_string(results[0])
 
 
-@pytest.mark.parametrize(
-    "func_name",
-    ["get_redis_string_async_dep", "get_sync_dependency_in_async_context_dep"],
-)
+@pytest.mark.parametrize("dep_name", ASYNC_REDIS_STRING_DEPS)
 async def test_resolve_async_dependency_multiple_times_return_different_results(
-    func_name,
-    get_redis_string_async_dep,  # noqa: U100
-    get_sync_dependency_in_async_context_dep,  # noqa: U100
+    request, dep_name
 ):
-    func = locals()[func_name]
+    func = request.getfixturevalue(dep_name)
+
     results = [await func() for _ in range(30)]
 
     assert len(set(results)) > 1
@@ -104,8 +104,11 @@ def test_can_pass_dependency(get_redis_string_dep):
     assert result == "http://redis:100000000"
 
 
-async def test_can_pass_dependency_async(get_redis_string_async_dep):
-    result = await get_redis_string_async_dep(port=100_000_000)
+@pytest.mark.parametrize("dep_name", ASYNC_REDIS_STRING_DEPS)
+async def test_can_pass_dependency_async(request, dep_name):
+    func = request.getfixturevalue(dep_name)
+
+    result = await func(port=100_000_000)
 
     assert result == "http://redis:100000000"
 
@@ -113,8 +116,9 @@ async def test_can_pass_dependency_async(get_redis_string_async_dep):
 def _check_redis_string(redis_string):
     __tracebackhide__ = True
 
-    assert redis_string.startswith("http://redis:")
-    assert int(redis_string.split(":")[-1]) <= 100_000
+    match = REDIS_STRING_RE.fullmatch(redis_string)
+    assert match, redis_string
+    assert int(match.group(1)) <= 100_000
 
 
 async def test_resolve_async_singleton_dependency_through_sync():
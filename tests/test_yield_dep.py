@@ -1,6 +1,5 @@
 import inspect
-import random
-from dataclasses import dataclass
+import itertools
 
 import pytest
 
@@ -13,15 +12,19 @@ from picodi import (
     shutdown_dependencies,
 )
 
+_next_int_service_value = itertools.count(1).__next__
+
 
-@dataclass
 class IntService:
-    value: int
-    closed: bool = False
+    __slots__ = ("value", "closed")
+
+    def __init__(self, value: int, closed: bool = False) -> None:
+        self.value = value
+        self.closed = closed
 
     @classmethod
     def create(cls):
-        return cls(random.randint(1, 100_000))
+        return cls(_next_int_service_value())
 
     def close(self):
         self.closed = True